@@ -1,5 +1,6 @@
 import os
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_cors import CORS
 from flask_session import Session
 from sqlalchemy import create_engine
@@ -8,24 +9,43 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 db_engine = None
 db_session = None
 
-def create_app():
+def create_app(config=None):
     global db_engine, db_session
     
     app = Flask(__name__)
     app.secret_key = os.environ.get('SESSION_SECRET', 'dev-secret-key-change-in-production')
+    app.config['TRUSTED_PROXY_COUNT'] = int(os.environ.get('TRUSTED_PROXY_COUNT', 0))
+    if config:
+        app.config.update(config)
+    
+    proxy_count = app.config['TRUSTED_PROXY_COUNT']
+    if proxy_count:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxy_count, x_proto=proxy_count, x_host=proxy_count)
     
     CORS(app, supports_credentials=True, origins=['*'])
     
-    app.config['SESSION_TYPE'] = 'filesystem'
+    app.config.setdefault('SESSION_TYPE', 'filesystem')
     app.config['SESSION_PERMANENT'] = False
     Session(app)
     
+    from app import http_cache
+    http_cache.init_app(app)
+    
+    from app import ratelimit
+    app.config.setdefault('RATELIMIT_STORAGE_URL', os.environ.get('REDIS_URL'))
+    if os.environ.get('RATELIMITS'):
+        app.config.setdefault('RATELIMITS', ratelimit.parse_limits(os.environ['RATELIMITS']))
+    ratelimit.init_app(app)
+    
     database_url = os.environ.get('DATABASE_URL')
     if database_url:
         db_engine = create_engine(database_url)
         session_factory = sessionmaker(bind=db_engine)
         db_session = scoped_session(session_factory)
     
+    from app import db_maintenance
+    db_maintenance.init_app(app)
+    
     from app.routes import auth, jobs, quotes, admin
     app.register_blueprint(auth.bp)
     app.register_blueprint(jobs.bp)
@@ -0,0 +1,181 @@
+import json
+from datetime import date
+
+import click
+from sqlalchemy import text
+
+PARTITIONED_TABLES = ['notifications', 'payments']
+PARTITION_MONTHS_AHEAD = 3
+
+# Probe queries for the hot access paths and the index each must be planned on.
+HOT_QUERIES = {
+    'jobs_by_customer': (
+        "SELECT * FROM jobs WHERE customer_id = 'probe' "
+        "ORDER BY created_at DESC LIMIT 50",
+        'IDX_jobs_customer_created',
+    ),
+    'jobs_due_by_status': (
+        "SELECT * FROM jobs WHERE status = 'in_review' AND deadline < now() "
+        "ORDER BY deadline LIMIT 50",
+        'IDX_jobs_status_deadline',
+    ),
+    'files_by_job': (
+        "SELECT * FROM job_files WHERE job_id = 'probe'",
+        'IDX_files_job',
+    ),
+    'unread_notifications': (
+        "SELECT * FROM notifications WHERE user_id = 'probe' AND is_read = false "
+        "ORDER BY created_at DESC LIMIT 50",
+        'IDX_notifications_user_read_created',
+    ),
+    'payments_by_order': (
+        "SELECT * FROM payments WHERE order_id = 'probe'",
+        'IDX_payments_order',
+    ),
+}
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(table, month_start):
+    return f'{table}_p{month_start:%Y_%m}'
+
+
+def create_monthly_partitions(conn, table, start, end):
+    """Create one range partition per month from ``start`` up to ``end``.
+
+    Rows that already landed in the default partition for a missing month
+    are moved into the new partition, since Postgres refuses to create a
+    partition whose range overlaps rows held by the default.
+    """
+    default = f'{table}_default'
+    has_default = conn.execute(text('SELECT to_regclass(:name)'), {'name': default}).scalar()
+    month = date(start.year, start.month, 1)
+    while month < end:
+        upper = add_months(month, 1)
+        name = partition_name(table, month)
+        bounds = {'lower': month, 'upper': upper}
+        exists = conn.execute(text('SELECT to_regclass(:name)'), {'name': name}).scalar()
+        stranded = has_default and not exists and conn.execute(text(
+            f'SELECT EXISTS (SELECT 1 FROM {default} '
+            'WHERE created_at >= :lower AND created_at < :upper)'
+        ), bounds).scalar()
+
+        if stranded:
+            conn.execute(text(f'ALTER TABLE {table} DETACH PARTITION {default}'))
+        conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS {name} '
+            f"PARTITION OF {table} FOR VALUES FROM ('{month}') TO ('{upper}')"
+        ))
+        if stranded:
+            conn.execute(text(
+                f'INSERT INTO {name} SELECT * FROM {default} '
+                'WHERE created_at >= :lower AND created_at < :upper'
+            ), bounds)
+            conn.execute(text(
+                f'DELETE FROM {default} WHERE created_at >= :lower AND created_at < :upper'
+            ), bounds)
+            conn.execute(text(f'ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT'))
+        month = upper
+
+
+def extend_partitions(conn, months_ahead=PARTITION_MONTHS_AHEAD):
+    today = date.today()
+    for table in PARTITIONED_TABLES:
+        create_monthly_partitions(conn, table, today, add_months(today, months_ahead + 1))
+
+
+def seq_scans(plan):
+    found = []
+    if plan.get('Node Type') == 'Seq Scan':
+        found.append(plan.get('Relation Name'))
+    for child in plan.get('Plans', []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def index_names(plan):
+    found = []
+    if 'Index Name' in plan:
+        found.append(plan['Index Name'])
+    for child in plan.get('Plans', []):
+        found.extend(index_names(child))
+    return found
+
+
+def plan_problems(plan, expected_index, parent_index):
+    """Describe why ``plan`` does not serve its query from ``expected_index``.
+
+    ``parent_index`` maps an index name from the plan to the index it was
+    created from, since scans on a partition name the partition's own copy.
+    """
+    problems = [f'sequential scan on {table}' for table in seq_scans(plan)]
+    used = {parent_index.get(name, name) for name in index_names(plan)}
+    if expected_index not in used:
+        found = ', '.join(sorted(used)) or 'no index'
+        problems.append(f'expected {expected_index}, plan uses {found}')
+    return problems
+
+
+def parent_indexes(conn, names):
+    rows = conn.execute(text(
+        'SELECT c.relname, r.relname FROM pg_class c '
+        'JOIN pg_class r ON r.oid = coalesce(pg_partition_root(c.oid), c.oid) '
+        "WHERE c.relkind IN ('i', 'I') AND c.relname = ANY(:names)"
+    ), {'names': list(names)})
+    return dict(rows.all())
+
+
+def check_query_plans(conn):
+    """Return {query name: [problems]} for hot queries not planned on their index.
+
+    Sequential scans are disabled for the check, so on a small development
+    database the planner only falls back to one when no usable index exists.
+    """
+    failures = {}
+    with conn.begin():
+        conn.execute(text('SET LOCAL enable_seqscan = off'))
+        for name, (sql, expected_index) in HOT_QUERIES.items():
+            result = conn.execute(text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+            plan = (result if isinstance(result, list) else json.loads(result))[0]['Plan']
+            parents = parent_indexes(conn, index_names(plan))
+            problems = plan_problems(plan, expected_index, parents)
+            if problems:
+                failures[name] = problems
+    return failures
+
+
+def get_engine():
+    from app import db_engine
+    if db_engine is None:
+        raise click.ClickException('DATABASE_URL is not configured')
+    return db_engine
+
+
+@click.command('check-query-plans')
+def check_query_plans_command():
+    """Fail if any hot query is not planned on its expected index."""
+    with get_engine().connect() as conn:
+        failures = check_query_plans(conn)
+    for name, problems in failures.items():
+        click.echo(f'{name}: {"; ".join(problems)}', err=True)
+    if failures:
+        raise SystemExit(1)
+    click.echo(f'All {len(HOT_QUERIES)} hot queries use their expected indexes')
+
+
+@click.command('extend-partitions')
+@click.option('--months-ahead', default=PARTITION_MONTHS_AHEAD, show_default=True)
+def extend_partitions_command(months_ahead):
+    """Create upcoming monthly partitions for partitioned tables."""
+    with get_engine().begin() as conn:
+        extend_partitions(conn, months_ahead)
+    click.echo('Partitions are up to date')
+
+
+def init_app(app):
+    app.cli.add_command(check_query_plans_command)
+    app.cli.add_command(extend_partitions_command)
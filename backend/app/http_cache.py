@@ -0,0 +1,131 @@
+import gzip
+import hashlib
+import json
+from functools import wraps
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_SIZE = 1024
+# Static payloads are compressed once and reused, so even small bodies pay off.
+STATIC_COMPRESS_MIN_SIZE = 128
+COMPRESS_MIMETYPES = {'application/json'}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def make_etag(*versions):
+    digest = hashlib.blake2b(digest_size=12)
+    for version in versions:
+        digest.update(str(version).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def negotiate_encoding(size, min_size=None):
+    if min_size is None:
+        min_size = current_app.config.get('COMPRESS_MIN_SIZE', COMPRESS_MIN_SIZE)
+    if size < min_size:
+        return None
+    accept = request.accept_encodings
+    if brotli is not None and accept['br']:
+        return 'br'
+    if accept['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def not_modified(etag):
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+def conditional(etag_func):
+    """Answer If-None-Match with 304 before the view builds its body.
+
+    ``etag_func`` receives the view arguments and returns a version tag
+    (see ``make_etag``) or None to skip conditional handling.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            etag = etag_func(*args, **kwargs)
+            if etag is None:
+                return f(*args, **kwargs)
+            if request.if_none_match.contains_weak(etag):
+                response = not_modified(etag)
+            else:
+                response = current_app.make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.set_etag(etag, weak=True)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+            return response
+        return decorated_function
+    return decorator
+
+
+class StaticPayload:
+    """JSON body serialised once, with its ETag and compressed variants cached."""
+
+    def __init__(self, data):
+        self.body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        self.etag = make_etag(self.body)
+        self._encoded = {}
+
+    def encoded(self, encoding):
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress(self.body, encoding)
+        return self._encoded[encoding]
+
+    def response(self):
+        if request.if_none_match.contains_weak(self.etag):
+            response = not_modified(self.etag)
+        else:
+            encoding = negotiate_encoding(len(self.body), STATIC_COMPRESS_MIN_SIZE)
+            body = self.encoded(encoding) if encoding else self.body
+            response = current_app.response_class(body, mimetype='application/json')
+            response.set_etag(self.etag, weak=True)
+            response.vary.add('Accept-Encoding')
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response
+
+
+def compress_response(response):
+    if response.status_code != 200 or response.direct_passthrough:
+        return response
+    if 'Content-Encoding' in response.headers:
+        return response
+    if response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    encoding = negotiate_encoding(len(data))
+    if encoding is None:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_app(app):
+    app.config.setdefault('COMPRESS_MIN_SIZE', COMPRESS_MIN_SIZE)
+    app.after_request(compress_response)
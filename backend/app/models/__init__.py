@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Text, Boolean, Numeric, DateTime, ForeignKey, Enum, JSON
+from sqlalchemy import Column, String, Integer, Text, Boolean, Numeric, DateTime, ForeignKey, Enum, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -86,6 +86,10 @@ class ReviewerProfile(Base):
 
 class Job(Base):
     __tablename__ = 'jobs'
+    __table_args__ = (
+        Index('IDX_jobs_customer_created', 'customer_id', 'created_at'),
+        Index('IDX_jobs_status_deadline', 'status', 'deadline'),
+    )
     
     id = Column(String, primary_key=True)
     customer_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'))
@@ -109,6 +113,9 @@ class Job(Base):
 
 class JobFile(Base):
     __tablename__ = 'job_files'
+    __table_args__ = (
+        Index('IDX_files_job', 'job_id'),
+    )
     
     id = Column(String, primary_key=True)
     job_id = Column(String, ForeignKey('jobs.id', ondelete='CASCADE'))
@@ -158,6 +165,12 @@ class Order(Base):
 
 class Payment(Base):
     __tablename__ = 'payments'
+    __table_args__ = (
+        Index('IDX_payments_order', 'order_id'),
+        Index('IDX_payments_status', 'status'),
+        Index('IDX_payments_gateway_tx', 'gateway_transaction_id'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
     id = Column(String, primary_key=True)
     order_id = Column(String, ForeignKey('orders.id', ondelete='CASCADE'))
@@ -167,8 +180,8 @@ class Payment(Base):
     currency = Column(String, default='ZAR')
     status = Column(String, default='pending')
     paid_at = Column(DateTime)
-    metadata = Column(JSON)
-    created_at = Column(DateTime, server_default=func.now())
+    meta = Column('metadata', JSON)
+    created_at = Column(DateTime, primary_key=True, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
@@ -192,6 +205,10 @@ class Invoice(Base):
 
 class Notification(Base):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        Index('IDX_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
     
     id = Column(String, primary_key=True)
     user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'))
@@ -199,8 +216,8 @@ class Notification(Base):
     title = Column(String)
     message = Column(Text)
     is_read = Column(Boolean, default=False)
-    metadata = Column(JSON)
-    created_at = Column(DateTime, server_default=func.now())
+    meta = Column('metadata', JSON)
+    created_at = Column(DateTime, primary_key=True, server_default=func.now())
 
 
 class Dispute(Base):
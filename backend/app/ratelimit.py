@@ -0,0 +1,262 @@
+import logging
+import math
+import threading
+import time
+
+from flask import current_app, jsonify, request, session
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Login and register are keyed by IP, and mobile carriers put many users
+# behind one address (CGNAT), so the per-IP limits are loose. Repeated
+# attempts against one account are caught by the per-email '.account' limits.
+RATELIMIT_DEFAULTS = {
+    'auth': '30/minute',
+    'auth.login': '30/minute',
+    'auth.register': '10/minute',
+    'auth.login.account': '20/hour',
+    'auth.register.account': '5/hour',
+    'quotes': '60/minute',
+    'quotes.calculate_quote': '30/minute',
+    'jobs': '120/minute',
+    'admin': '120/minute',
+}
+
+IP_KEYED_ENDPOINTS = {'auth.login', 'auth.register'}
+ACCOUNT_KEYED_ENDPOINTS = {'auth.login', 'auth.register'}
+
+PERIODS = {
+    'second': 1,
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400,
+}
+
+
+def parse_rate(spec):
+    """Turn '10/minute' into a (capacity, tokens per second) pair."""
+    count, _, period = spec.partition('/')
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period.strip()]
+
+
+def parse_limits(value):
+    """Turn 'auth.login=60/minute,quotes=120/minute' into a limits mapping."""
+    limits = {}
+    for item in value.split(','):
+        if item.strip():
+            name, _, spec = item.partition('=')
+            limits[name.strip()] = spec.strip()
+    return limits
+
+
+class MemoryStore:
+    """Token buckets held in this process; the default when no shared store is configured."""
+
+    IDLE_TTL = 3600
+    SWEEP_EVERY = 1024
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def consume(self, key, capacity, rate):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = capacity
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                retry_after = 0
+            else:
+                self._buckets[key] = (tokens, now)
+                retry_after = (1 - tokens) / rate
+
+            self._calls += 1
+            if self._calls % self.SWEEP_EVERY == 0:
+                self._sweep(now)
+        return retry_after == 0, retry_after
+
+    def _sweep(self, now):
+        stale = [k for k, (_, ts) in self._buckets.items() if now - ts > self.IDLE_TTL]
+        for k in stale:
+            del self._buckets[k]
+
+
+class RedisStore:
+    """Token buckets shared by every worker through Redis.
+
+    Every allowed request costs one round trip; only keys already known to
+    be exhausted are answered in process (see ``RateLimiter``). While Redis
+    is failing, requests go straight to per-worker buckets for
+    ``FAILURE_COOLDOWN`` seconds instead of waiting on the socket timeout.
+    """
+
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(retry_after)
+"""
+
+    SOCKET_TIMEOUT = 0.25
+    FAILURE_COOLDOWN = 5
+
+    def __init__(self, url, prefix='ratelimit:'):
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=self.SOCKET_TIMEOUT,
+            socket_connect_timeout=self.SOCKET_TIMEOUT,
+        )
+        self._script = self._client.register_script(self.SCRIPT)
+        self._prefix = prefix
+        self._fallback = MemoryStore()
+        self._down_until = None
+
+    def consume(self, key, capacity, rate):
+        if self._down_until is not None and time.monotonic() < self._down_until:
+            return self._fallback.consume(key, capacity, rate)
+
+        try:
+            retry_after = float(self._script(keys=[self._prefix + key], args=[capacity, rate]))
+        except redis.RedisError as exc:
+            # Keep limiting per worker rather than failing every request.
+            if self._down_until is None:
+                logger.warning('Rate limit store unavailable, using in-process buckets: %s', exc)
+            self._down_until = time.monotonic() + self.FAILURE_COOLDOWN
+            return self._fallback.consume(key, capacity, rate)
+
+        if self._down_until is not None:
+            logger.warning('Rate limit store recovered')
+            self._down_until = None
+        return retry_after == 0, retry_after
+
+
+class RateLimiter:
+    """Per-route token buckets keyed by user id, falling back to client IP.
+
+    Keys already known to be empty are rejected from a local table until
+    their retry time, so abusive clients never reach the shared store.
+    """
+
+    MAX_BLOCKED = 10000
+
+    def __init__(self, store=None):
+        self.store = store or MemoryStore()
+        self._limits = {}
+        self._blocked = {}
+
+    def configure(self, limits):
+        self._limits = {name: parse_rate(spec) for name, spec in limits.items() if spec}
+
+    def limit_for(self, endpoint, blueprint):
+        limit = self._limits.get(endpoint)
+        if limit is None and blueprint:
+            limit = self._limits.get(blueprint)
+        return limit
+
+    def hit(self, key, capacity, rate):
+        now = time.monotonic()
+        blocked_until = self._blocked.get(key)
+        if blocked_until is not None:
+            if now < blocked_until:
+                return False, blocked_until - now
+            self._blocked.pop(key, None)
+
+        allowed, retry_after = self.store.consume(key, capacity, rate)
+        if not allowed:
+            if len(self._blocked) >= self.MAX_BLOCKED:
+                self._blocked = {k: t for k, t in self._blocked.items() if t > now}
+            self._blocked[key] = now + retry_after
+        return allowed, retry_after
+
+
+def client_key(endpoint):
+    user = session.get('user')
+    if user and endpoint not in IP_KEYED_ENDPOINTS:
+        return 'user:' + user['id']
+    return 'ip:' + (request.remote_addr or 'unknown')
+
+
+def account_key(endpoint):
+    if endpoint not in ACCOUNT_KEYED_ENDPOINTS:
+        return None
+    data = request.get_json(silent=True)
+    email = data.get('email') if isinstance(data, dict) else None
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return 'account:' + email.strip().lower()
+
+
+def too_many_requests(retry_after):
+    response = jsonify({'message': 'Too many requests'})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def check_rate_limit():
+    if request.method == 'OPTIONS' or request.endpoint is None:
+        return None
+
+    limiter = current_app.extensions['ratelimit']
+    endpoint = request.endpoint
+    limit = limiter.limit_for(endpoint, request.blueprint)
+    if limit is not None:
+        allowed, retry_after = limiter.hit(f'{endpoint}:{client_key(endpoint)}', *limit)
+        if not allowed:
+            return too_many_requests(retry_after)
+
+    account_limit = limiter.limit_for(endpoint + '.account', None)
+    key = account_key(endpoint)
+    if account_limit is not None and key is not None:
+        allowed, retry_after = limiter.hit(f'{endpoint}:{key}', *account_limit)
+        if not allowed:
+            return too_many_requests(retry_after)
+    return None
+
+
+def init_app(app):
+    app.config.setdefault('RATELIMIT_ENABLED', True)
+    app.config.setdefault('RATELIMIT_STORAGE_URL', None)
+    limits = dict(RATELIMIT_DEFAULTS)
+    limits.update(app.config.get('RATELIMITS', {}))
+
+    storage_url = app.config['RATELIMIT_STORAGE_URL']
+    store = None
+    if storage_url:
+        if redis is None:
+            raise RuntimeError('RATELIMIT_STORAGE_URL is set but the redis package is not installed')
+        store = RedisStore(storage_url)
+    limiter = RateLimiter(store)
+    limiter.configure(limits)
+    app.extensions['ratelimit'] = limiter
+
+    if app.config['RATELIMIT_ENABLED']:
+        app.before_request(check_rate_limit)
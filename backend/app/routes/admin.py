@@ -1,8 +1,18 @@
 from flask import Blueprint, request, jsonify, session
 from functools import wraps
+from collections import defaultdict
+from datetime import datetime, timedelta
+from app.models import JobStatus
+from app.routes.auth import users_store, find_user
+from app.routes.jobs import jobs_store, jobs_lock, create_notification
 
 bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
+MAX_BATCH_SIZE = 500
+BATCH_ACTIONS = ('reassign', 'status', 'extend_deadline')
+JOB_STATUSES = {status.value for status in JobStatus}
+TERMINAL_STATUSES = {JobStatus.completed.value, JobStatus.cancelled.value}
+
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -30,4 +40,115 @@ def get_unassigned_jobs():
 @bp.route('/reviewers', methods=['GET'])
 @admin_required
 def get_reviewers():
-    return jsonify([])
+    return jsonify([u for u in users_store.values() if u.get('role') == 'reviewer'])
+
+
+def parse_batch_change(data):
+    action = data.get('action')
+    if action == 'reassign':
+        reviewer = find_user(data.get('reviewerId'))
+        if not reviewer or reviewer.get('role') != 'reviewer':
+            return None, 'reviewerId must be an existing reviewer'
+        return {'reviewerId': reviewer['id']}, None
+    if action == 'status':
+        status = data.get('status')
+        if status not in JOB_STATUSES:
+            return None, 'Invalid status'
+        return {'status': status}, None
+    if action == 'extend_deadline':
+        hours = data.get('extendHours')
+        if not isinstance(hours, int) or isinstance(hours, bool) or hours <= 0:
+            return None, 'extendHours must be a positive integer'
+        return {'extendHours': hours}, None
+    return None, f"action must be one of: {', '.join(BATCH_ACTIONS)}"
+
+def extend_deadline(deadline, hours):
+    if not isinstance(deadline, str):
+        return None
+    try:
+        extended = datetime.fromisoformat(deadline) + timedelta(hours=hours)
+    except ValueError:
+        return None
+    value = extended.isoformat()
+    if deadline.endswith('Z'):
+        value = value.replace('+00:00', 'Z')
+    return value
+
+def plan_job_change(job, action, change):
+    if action == 'reassign':
+        if job.get('status') in TERMINAL_STATUSES:
+            return None, f"Job cannot be reassigned in status {job['status']}"
+        if job.get('reviewerId') == change['reviewerId']:
+            return None, 'Job is already assigned to this reviewer'
+        updates = {'reviewerId': change['reviewerId']}
+        if job.get('status') == 'paid':
+            updates['status'] = 'assigned'
+        return updates, None
+    if action == 'status':
+        return {'status': change['status']}, None
+    if not job.get('deadline'):
+        return None, 'Job has no deadline'
+    deadline = extend_deadline(job['deadline'], change['extendHours'])
+    if deadline is None:
+        return None, 'Job has an invalid deadline'
+    return {'deadline': deadline}, None
+
+@bp.route('/jobs/batch', methods=['POST'])
+@admin_required
+def batch_update_jobs():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'message': 'Request body must be a JSON object'}), 400
+    
+    job_ids = data.get('jobIds')
+    if not isinstance(job_ids, list) or not job_ids:
+        return jsonify({'message': 'jobIds must be a non-empty list'}), 400
+    if not all(isinstance(job_id, str) and job_id for job_id in job_ids):
+        return jsonify({'message': 'jobIds must contain non-empty strings'}), 400
+    if len(job_ids) > MAX_BATCH_SIZE:
+        return jsonify({'message': f'At most {MAX_BATCH_SIZE} jobs per batch'}), 400
+    
+    change, error = parse_batch_change(data)
+    if error:
+        return jsonify({'message': error}), 400
+    
+    action = data['action']
+    results = []
+    affected = defaultdict(list)
+    
+    with jobs_lock:
+        planned = []
+        for job_id in dict.fromkeys(job_ids):
+            job = jobs_store.get(job_id)
+            if not job:
+                results.append({'jobId': job_id, 'success': False, 'message': 'Job not found'})
+                continue
+            updates, message = plan_job_change(job, action, change)
+            if message:
+                results.append({'jobId': job_id, 'success': False, 'message': message})
+                continue
+            planned.append((job, updates))
+            results.append({'jobId': job_id, 'success': True, 'job': job})
+        
+        now = datetime.utcnow().isoformat()
+        for job, updates in planned:
+            users = {job.get('customerId'), job.get('reviewerId'), updates.get('reviewerId')}
+            job.update(updates)
+            job['updatedAt'] = now
+            for user_id in users - {None}:
+                affected[user_id].append(job['id'])
+    
+    for user_id, updated_ids in affected.items():
+        create_notification(
+            user_id,
+            'jobs_updated',
+            'Jobs updated',
+            f'{len(updated_ids)} job(s) were updated by an administrator',
+            {'action': action, 'jobIds': updated_ids}
+        )
+    
+    return jsonify({
+        'updated': sum(1 for r in results if r['success']),
+        'failed': sum(1 for r in results if not r['success']),
+        'results': results
+    })
@@ -1,9 +1,38 @@
 from flask import Blueprint, request, jsonify, session
 import uuid
+from app.http_cache import conditional, make_etag
 
 bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
+# Keyed by lowercased email so repeat logins reuse one record.
+users_store = {}
+
+def find_user(user_id):
+    return next((u for u in users_store.values() if u['id'] == user_id), None)
+
+def save_user(email, first_name, last_name):
+    key = email.strip().lower()
+    user = users_store.get(key)
+    if user is None:
+        user = {
+            'id': str(uuid.uuid4()),
+            'email': email,
+            'role': 'customer',
+            'profileImageUrl': None
+        }
+        users_store[key] = user
+    user['firstName'] = first_name or user.get('firstName') or email.split('@')[0].title()
+    user['lastName'] = last_name or user.get('lastName', '')
+    return user
+
+def user_etag():
+    user = session.get('user')
+    if not user:
+        return None
+    return make_etag(*sorted(user.items()))
+
 @bp.route('/user', methods=['GET'])
+@conditional(user_etag)
 def get_user():
     user = session.get('user')
     if not user:
@@ -19,15 +48,7 @@ def login():
     if not email or not password:
         return jsonify({'message': 'Email and password required'}), 400
     
-    user = {
-        'id': str(uuid.uuid4()),
-        'email': email,
-        'firstName': email.split('@')[0].title(),
-        'lastName': '',
-        'role': 'customer',
-        'profileImageUrl': None
-    }
-    
+    user = save_user(email, '', '')
     session['user'] = user
     return jsonify(user)
 
@@ -42,15 +63,7 @@ def register():
     if not email or not password:
         return jsonify({'message': 'Email and password required'}), 400
     
-    user = {
-        'id': str(uuid.uuid4()),
-        'email': email,
-        'firstName': first_name or email.split('@')[0].title(),
-        'lastName': last_name,
-        'role': 'customer',
-        'profileImageUrl': None
-    }
-    
+    user = save_user(email, first_name, last_name)
     session['user'] = user
     return jsonify(user), 201
 
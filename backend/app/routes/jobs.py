@@ -1,12 +1,16 @@
 from flask import Blueprint, request, jsonify, session
 from functools import wraps
 import uuid
+import threading
 from datetime import datetime
+from app.http_cache import conditional, make_etag
 
 bp = Blueprint('jobs', __name__, url_prefix='/api')
 
 jobs_store = {}
 files_store = {}
+notifications_store = {}
+jobs_lock = threading.Lock()
 
 def login_required(f):
     @wraps(f)
@@ -16,8 +20,22 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def jobs_etag():
+    user = session['user']
+    versions = sorted(
+        (j['id'], j['updatedAt']) for j in jobs_store.values() if j.get('customerId') == user['id']
+    )
+    return make_etag(user['id'], *versions)
+
+def job_etag(job_id):
+    job = jobs_store.get(job_id)
+    if not job:
+        return None
+    return make_etag(job['id'], job['updatedAt'])
+
 @bp.route('/jobs', methods=['GET'])
 @login_required
+@conditional(jobs_etag)
 def get_jobs():
     user = session['user']
     user_jobs = [j for j in jobs_store.values() if j.get('customerId') == user['id']]
@@ -25,6 +43,7 @@ def get_jobs():
 
 @bp.route('/jobs/<job_id>', methods=['GET'])
 @login_required
+@conditional(job_etag)
 def get_job(job_id):
     job = jobs_store.get(job_id)
     if not job:
@@ -62,12 +81,12 @@ def update_job(job_id):
         return jsonify({'message': 'Job not found'}), 404
     
     data = request.get_json()
-    for key, value in data.items():
-        if key in job:
-            job[key] = value
-    job['updatedAt'] = datetime.utcnow().isoformat()
-    
-    jobs_store[job_id] = job
+    with jobs_lock:
+        for key, value in data.items():
+            if key in job:
+                job[key] = value
+        job['updatedAt'] = datetime.utcnow().isoformat()
+        jobs_store[job_id] = job
     return jsonify(job)
 
 @bp.route('/jobs/<job_id>/files', methods=['GET'])
@@ -101,13 +120,35 @@ def create_job_file(job_id):
 @bp.route('/notifications', methods=['GET'])
 @login_required
 def get_notifications():
-    return jsonify([])
+    user = session['user']
+    user_notifications = [n for n in notifications_store.values() if n.get('userId') == user['id']]
+    user_notifications.sort(key=lambda n: n['createdAt'], reverse=True)
+    return jsonify(user_notifications)
 
 @bp.route('/notifications/<notification_id>/read', methods=['PATCH'])
 @login_required
 def mark_notification_read(notification_id):
+    notification = notifications_store.get(notification_id)
+    if notification and notification.get('userId') == session['user']['id']:
+        notification['isRead'] = True
     return jsonify({'success': True})
 
+def create_notification(user_id, type, title, message, metadata=None):
+    notification_id = str(uuid.uuid4())
+    notification = {
+        'id': notification_id,
+        'userId': user_id,
+        'type': type,
+        'title': title,
+        'message': message,
+        'isRead': False,
+        'metadata': metadata,
+        'createdAt': datetime.utcnow().isoformat()
+    }
+    
+    notifications_store[notification_id] = notification
+    return notification
+
 @bp.route('/orders', methods=['GET'])
 @login_required
 def get_orders():
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify, session
 from functools import wraps
 import uuid
 from datetime import datetime, timedelta
+from app.http_cache import StaticPayload
 
 bp = Blueprint('quotes', __name__, url_prefix='/api')
 
@@ -20,6 +21,14 @@ BASE_PRICES = {
     'formatting': 0.10,
 }
 
+PRICING_PAYLOAD_DATA = [
+    {'serviceType': 'proofreading', 'pricePerWord': '0.08', 'minPrice': '50.00'},
+    {'serviceType': 'editing', 'pricePerWord': '0.15', 'minPrice': '50.00'},
+    {'serviceType': 'formatting', 'pricePerWord': '0.10', 'minPrice': '50.00'}
+]
+
+PRICING_PAYLOAD = StaticPayload(PRICING_PAYLOAD_DATA)
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -100,8 +109,4 @@ def calculate_quote():
 
 @bp.route('/pricing', methods=['GET'])
 def get_pricing():
-    return jsonify([
-        {'serviceType': 'proofreading', 'pricePerWord': '0.08', 'minPrice': '50.00'},
-        {'serviceType': 'editing', 'pricePerWord': '0.15', 'minPrice': '50.00'},
-        {'serviceType': 'formatting', 'pricePerWord': '0.10', 'minPrice': '50.00'}
-    ])
+    return PRICING_PAYLOAD.response()
@@ -0,0 +1,195 @@
+"""baseline schema
+
+Tables may already exist when the database was provisioned with
+``npm run db:push``; only missing tables are created.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# Enum types shared with db:push; created here only when missing.
+ENUMS = {
+    'currency': postgresql.ENUM('ZAR', 'USD', 'EUR', 'GBP', name='currency', create_type=False),
+    'payment_status': postgresql.ENUM(
+        'pending', 'processing', 'completed', 'failed', 'refunded',
+        name='payment_status', create_type=False,
+    ),
+}
+
+
+def uuid_id():
+    return sa.Column('id', sa.String, primary_key=True, server_default=sa.text('gen_random_uuid()'))
+
+
+def timestamps():
+    return [
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime, server_default=sa.func.now()),
+    ]
+
+
+TABLES = [
+    ('users', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('email', sa.String, unique=True),
+        sa.Column('first_name', sa.String),
+        sa.Column('last_name', sa.String),
+        sa.Column('profile_image_url', sa.String),
+        sa.Column('role', sa.String, server_default='customer'),
+        sa.Column('phone', sa.String),
+        sa.Column('company', sa.String),
+        sa.Column('preferred_currency', sa.String, server_default='ZAR'),
+        sa.Column('is_active', sa.Boolean, server_default=sa.true()),
+        *timestamps(),
+    ]),
+    ('reviewer_profiles', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('user_id', sa.String, sa.ForeignKey('users.id', ondelete='CASCADE')),
+        sa.Column('specializations', sa.JSON),
+        sa.Column('years_experience', sa.Integer, server_default='0'),
+        sa.Column('bio', sa.Text),
+        sa.Column('rating', sa.Numeric(3, 2), server_default='5.00'),
+        sa.Column('completed_jobs', sa.Integer, server_default='0'),
+        sa.Column('is_available', sa.Boolean, server_default=sa.true()),
+        sa.Column('max_concurrent_jobs', sa.Integer, server_default='5'),
+        *timestamps(),
+    ]),
+    ('jobs', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('customer_id', sa.String, sa.ForeignKey('users.id', ondelete='CASCADE')),
+        sa.Column('reviewer_id', sa.String, sa.ForeignKey('users.id')),
+        sa.Column('service_type', sa.String),
+        sa.Column('turnaround', sa.String),
+        sa.Column('status', sa.String, server_default='draft'),
+        sa.Column('title', sa.String),
+        sa.Column('instructions', sa.Text),
+        sa.Column('word_count', sa.Integer, server_default='0'),
+        sa.Column('deadline', sa.DateTime),
+        sa.Column('completed_at', sa.DateTime),
+        *timestamps(),
+    ]),
+    ('job_files', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.id', ondelete='CASCADE')),
+        sa.Column('filename', sa.String),
+        sa.Column('original_name', sa.String),
+        sa.Column('mime_type', sa.String),
+        sa.Column('size', sa.Integer),
+        sa.Column('storage_path', sa.String),
+        sa.Column('is_original', sa.Boolean, server_default=sa.true()),
+        sa.Column('virus_scan_status', sa.String, server_default='pending'),
+        sa.Column('uploaded_at', sa.DateTime, server_default=sa.func.now()),
+    ]),
+    ('quotes', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.id', ondelete='CASCADE')),
+        sa.Column('word_count', sa.Integer),
+        sa.Column('base_price', sa.Numeric(10, 2)),
+        sa.Column('turnaround_multiplier', sa.Numeric(4, 2), server_default='1.00'),
+        sa.Column('subtotal', sa.Numeric(10, 2)),
+        sa.Column('vat_amount', sa.Numeric(10, 2), server_default='0.00'),
+        sa.Column('total', sa.Numeric(10, 2)),
+        sa.Column('currency', sa.String, server_default='ZAR'),
+        sa.Column('exchange_rate', sa.Numeric(10, 6), server_default='1.000000'),
+        sa.Column('valid_until', sa.DateTime),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+    ]),
+    ('orders', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.id', ondelete='CASCADE')),
+        sa.Column('quote_id', sa.String, sa.ForeignKey('quotes.id')),
+        sa.Column('customer_id', sa.String, sa.ForeignKey('users.id')),
+        sa.Column('order_number', sa.String, unique=True),
+        sa.Column('status', sa.String, server_default='pending'),
+        *timestamps(),
+    ]),
+    ('payments', lambda: [
+        uuid_id(),
+        sa.Column('order_id', sa.String, sa.ForeignKey('orders.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('gateway', sa.String, nullable=False),
+        sa.Column('gateway_transaction_id', sa.String),
+        sa.Column('amount', sa.Numeric(10, 2), nullable=False),
+        sa.Column('currency', ENUMS['currency'], server_default='ZAR'),
+        sa.Column('status', ENUMS['payment_status'], server_default='pending'),
+        sa.Column('paid_at', sa.DateTime),
+        sa.Column('metadata', postgresql.JSONB),
+        *timestamps(),
+    ]),
+    ('invoices', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('order_id', sa.String, sa.ForeignKey('orders.id', ondelete='CASCADE')),
+        sa.Column('invoice_number', sa.String, unique=True),
+        sa.Column('customer_name', sa.String),
+        sa.Column('customer_email', sa.String),
+        sa.Column('customer_address', sa.Text),
+        sa.Column('vat_number', sa.String),
+        sa.Column('subtotal', sa.Numeric(10, 2)),
+        sa.Column('vat_amount', sa.Numeric(10, 2), server_default='0.00'),
+        sa.Column('total', sa.Numeric(10, 2)),
+        sa.Column('currency', sa.String, server_default='ZAR'),
+        sa.Column('issued_at', sa.DateTime, server_default=sa.func.now()),
+        sa.Column('pdf_path', sa.String),
+    ]),
+    ('notifications', lambda: [
+        uuid_id(),
+        sa.Column('user_id', sa.String, sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('type', sa.String, nullable=False),
+        sa.Column('title', sa.String, nullable=False),
+        sa.Column('message', sa.Text),
+        sa.Column('is_read', sa.Boolean, server_default=sa.false()),
+        sa.Column('metadata', postgresql.JSONB),
+        sa.Column('created_at', sa.DateTime, server_default=sa.func.now()),
+    ]),
+    ('disputes', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('job_id', sa.String, sa.ForeignKey('jobs.id', ondelete='CASCADE')),
+        sa.Column('raised_by_id', sa.String, sa.ForeignKey('users.id')),
+        sa.Column('reason', sa.Text),
+        sa.Column('status', sa.String, server_default='open'),
+        sa.Column('resolution', sa.Text),
+        sa.Column('resolved_by_id', sa.String, sa.ForeignKey('users.id')),
+        sa.Column('resolved_at', sa.DateTime),
+        *timestamps(),
+    ]),
+    ('pricing_config', lambda: [
+        sa.Column('id', sa.String, primary_key=True),
+        sa.Column('service_type', sa.String),
+        sa.Column('price_per_word', sa.Numeric(6, 4)),
+        sa.Column('min_price', sa.Numeric(10, 2), server_default='50.00'),
+        sa.Column('turnaround_24h_multiplier', sa.Numeric(4, 2), server_default='2.00'),
+        sa.Column('turnaround_48h_multiplier', sa.Numeric(4, 2), server_default='1.50'),
+        sa.Column('turnaround_72h_multiplier', sa.Numeric(4, 2), server_default='1.25'),
+        sa.Column('turnaround_1week_multiplier', sa.Numeric(4, 2), server_default='1.00'),
+        sa.Column('vat_rate', sa.Numeric(5, 2), server_default='15.00'),
+        sa.Column('is_active', sa.Boolean, server_default=sa.true()),
+        *timestamps(),
+    ]),
+]
+
+
+def upgrade():
+    conn = op.get_bind()
+    for enum in ENUMS.values():
+        enum.create(conn, checkfirst=True)
+
+    existing = set(sa.inspect(conn).get_table_names())
+    for name, columns in TABLES:
+        if name not in existing:
+            op.create_table(name, *columns())
+
+
+def downgrade():
+    # Tables and enum types may predate this revision (db:push), so dropping
+    # them here could destroy data this migration never created.
+    pass
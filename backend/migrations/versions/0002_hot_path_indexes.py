@@ -0,0 +1,46 @@
+"""hot path indexes on jobs and job_files
+
+Built with CREATE INDEX CONCURRENTLY outside the migration transaction so
+writes to jobs are not blocked while the indexes are built. Names match
+shared/schema.ts so db:push sees the same indexes. The composite jobs
+indexes replace the single-column ones they lead with.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('IDX_jobs_customer_created', 'jobs', ['customer_id', 'created_at']),
+    ('IDX_jobs_status_deadline', 'jobs', ['status', 'deadline']),
+    ('IDX_files_job', 'job_files', ['job_id']),
+]
+
+REPLACED_INDEXES = [
+    ('IDX_jobs_customer', 'jobs', ['customer_id']),
+    ('IDX_jobs_status', 'jobs', ['status']),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in INDEXES[:2]:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
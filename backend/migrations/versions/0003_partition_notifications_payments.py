@@ -0,0 +1,122 @@
+"""range-partition notifications and payments by created_at
+
+Each table is rebuilt as a partitioned table with monthly partitions from
+its oldest row up to a few months ahead, plus a default partition. The
+primary key becomes (id, created_at) because Postgres requires the
+partition key in every unique constraint. Indexes on the new parents are
+propagated to every partition; ``flask extend-partitions`` keeps future
+months provisioned and moves any rows that landed in the default
+partition into their month. Both tables are excluded from db:push, which
+would otherwise try to drop the partitions.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from datetime import date
+
+from alembic import op
+from sqlalchemy import text
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of the partition layout so this revision does not change when
+# app.db_maintenance does.
+MONTHS_AHEAD = 3
+
+TABLES = {
+    'notifications': {
+        'foreign_key': (
+            'CONSTRAINT notifications_user_id_fkey '
+            'FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE'
+        ),
+        'indexes': [
+            ('IDX_notifications_user_read_created', ['user_id', 'is_read', 'created_at']),
+        ],
+    },
+    'payments': {
+        'foreign_key': (
+            'CONSTRAINT payments_order_id_fkey '
+            'FOREIGN KEY (order_id) REFERENCES orders (id) ON DELETE CASCADE'
+        ),
+        'indexes': [
+            ('IDX_payments_order', ['order_id']),
+            ('IDX_payments_status', ['status']),
+            ('IDX_payments_gateway_tx', ['gateway_transaction_id']),
+        ],
+    },
+}
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def create_monthly_partitions(conn, table, start, end):
+    month = date(start.year, start.month, 1)
+    while month < end:
+        upper = add_months(month, 1)
+        conn.execute(text(
+            f'CREATE TABLE {table}_p{month:%Y_%m} '
+            f"PARTITION OF {table} FOR VALUES FROM ('{month}') TO ('{upper}')"
+        ))
+        month = upper
+
+
+def rebuild(conn, table, spec, old, primary_key, partitioned):
+    # Move the old table's key names aside so the rebuilt table keeps them.
+    conn.execute(text(f'ALTER TABLE {table} RENAME TO {old}'))
+    names = conn.execute(text(
+        "SELECT conname FROM pg_constraint "
+        "WHERE conrelid = CAST(:old AS regclass) AND contype IN ('p', 'f')"
+    ), {'old': old}).scalars().all()
+    for name in names:
+        conn.execute(text(f'ALTER TABLE {old} RENAME CONSTRAINT "{name}" TO "{name}_old"'))
+
+    partition_clause = ' PARTITION BY RANGE (created_at)' if partitioned else ''
+    conn.execute(text(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + partition_clause
+    ))
+    conn.execute(text(f'ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL'))
+    conn.execute(text(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})'))
+    conn.execute(text(f'ALTER TABLE {table} ADD {spec["foreign_key"]}'))
+
+
+def copy_and_index(conn, table, spec, old):
+    conn.execute(text(f'INSERT INTO {table} SELECT * FROM {old}'))
+    conn.execute(text(f'DROP TABLE {old}'))
+
+    for name, columns in spec['indexes']:
+        op.create_index(name, table, columns)
+
+
+def upgrade():
+    conn = op.get_bind()
+    end = add_months(date.today(), MONTHS_AHEAD + 1)
+
+    for table, spec in TABLES.items():
+        old = f'{table}_unpartitioned'
+        conn.execute(text(f'UPDATE {table} SET created_at = now() WHERE created_at IS NULL'))
+        rebuild(conn, table, spec, old, 'id, created_at', partitioned=True)
+
+        start = conn.execute(text(f'SELECT min(created_at) FROM {old}')).scalar() or date.today()
+        create_monthly_partitions(conn, table, start, end)
+        conn.execute(text(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT'))
+
+        copy_and_index(conn, table, spec, old)
+
+
+def downgrade():
+    conn = op.get_bind()
+
+    for table, spec in TABLES.items():
+        old = f'{table}_partitioned'
+        rebuild(conn, table, spec, old, 'id', partitioned=False)
+        copy_and_index(conn, table, spec, old)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app import create_app
+from app.routes import auth, jobs, quotes
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmark', action='store_true', help='run timing benchmarks')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: timing benchmark, run with --benchmark -s')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='benchmark; run with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    def factory(**config):
+        settings = {
+            'TESTING': True,
+            'SESSION_FILE_DIR': str(tmp_path / 'sessions'),
+            'RATELIMIT_ENABLED': False,
+            'RATELIMIT_STORAGE_URL': None,
+        }
+        settings.update(config)
+        return create_app(settings)
+    return factory
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def clear_stores():
+    yield
+    auth.users_store.clear()
+    jobs.jobs_store.clear()
+    jobs.files_store.clear()
+    jobs.notifications_store.clear()
+    quotes.quotes_store.clear()
+
+
+def login(client, email='customer@example.com', role='customer'):
+    user = client.post('/api/auth/login', json={'email': email, 'password': 'secret'}).get_json()
+    if role != 'customer':
+        with client.session_transaction() as sess:
+            sess['user']['role'] = role
+        auth.find_user(user['id'])['role'] = role
+        user['role'] = role
+    return user
@@ -0,0 +1,181 @@
+import pytest
+
+from app.routes import jobs
+from conftest import login
+
+
+@pytest.fixture
+def customer(app):
+    client = app.test_client()
+    user = login(client, 'customer@example.com')
+    return client, user
+
+
+@pytest.fixture
+def admin(app):
+    client = app.test_client()
+    login(client, 'admin@example.com', role='admin')
+    return client
+
+
+@pytest.fixture
+def reviewer(app):
+    return login(app.test_client(), 'reviewer@example.com', role='reviewer')
+
+
+def create_jobs(client, count, **fields):
+    ids = [client.post('/api/jobs', json={'title': f'Job {i}'}).get_json()['id'] for i in range(count)]
+    for job_id in ids:
+        jobs.jobs_store[job_id].update(fields)
+    return ids
+
+
+def batch(client, **body):
+    return client.post('/api/admin/jobs/batch', json=body)
+
+
+def notifications_for(user_id):
+    return [n for n in jobs.notifications_store.values() if n['userId'] == user_id]
+
+
+def test_batch_requires_admin(customer):
+    client, _ = customer
+
+    assert batch(client, jobIds=['x'], action='status', status='paid').status_code == 403
+
+
+@pytest.mark.parametrize('body', [
+    [1],
+    'jobs',
+    {'jobIds': [], 'action': 'status', 'status': 'paid'},
+    {'jobIds': [['a']], 'action': 'status', 'status': 'paid'},
+    {'jobIds': [{'id': 'a'}], 'action': 'status', 'status': 'paid'},
+    {'jobIds': [''], 'action': 'status', 'status': 'paid'},
+    {'jobIds': ['a'], 'action': 'delete'},
+    {'jobIds': ['a'], 'action': 'status', 'status': 'bogus'},
+    {'jobIds': ['a'], 'action': 'extend_deadline', 'extendHours': True},
+])
+def test_batch_rejects_invalid_input(admin, body):
+    response = admin.post('/api/admin/jobs/batch', json=body)
+
+    assert response.status_code == 400
+
+
+def test_reassign_requires_existing_reviewer(admin, customer):
+    job_ids = create_jobs(customer[0], 1)
+
+    response = batch(admin, jobIds=job_ids, action='reassign', reviewerId=customer[1]['id'])
+
+    assert response.status_code == 400
+    assert 'reviewerId' not in jobs.jobs_store[job_ids[0]]
+
+
+def test_reassign_moves_paid_jobs_to_assigned(admin, customer, reviewer):
+    paid, in_review = create_jobs(customer[0], 1, status='paid') + create_jobs(customer[0], 1, status='in_review')
+
+    response = batch(admin, jobIds=[paid, in_review], action='reassign', reviewerId=reviewer['id'])
+
+    assert response.get_json()['updated'] == 2
+    assert jobs.jobs_store[paid]['status'] == 'assigned'
+    assert jobs.jobs_store[in_review]['status'] == 'in_review'
+    assert jobs.jobs_store[paid]['reviewerId'] == reviewer['id']
+
+
+def test_reassign_rejects_terminal_jobs(admin, customer, reviewer):
+    done, cancelled = create_jobs(customer[0], 1, status='completed') + create_jobs(customer[0], 1, status='cancelled')
+
+    body = batch(admin, jobIds=[done, cancelled], action='reassign', reviewerId=reviewer['id']).get_json()
+
+    assert body['updated'] == 0
+    assert [r['message'] for r in body['results']] == [
+        'Job cannot be reassigned in status completed',
+        'Job cannot be reassigned in status cancelled',
+    ]
+    assert 'reviewerId' not in jobs.jobs_store[done]
+    assert jobs.notifications_store == {}
+
+
+def test_reassign_skips_jobs_already_with_reviewer(admin, customer, reviewer):
+    job_ids = create_jobs(customer[0], 2, status='assigned', reviewerId=reviewer['id'])
+
+    body = batch(admin, jobIds=job_ids, action='reassign', reviewerId=reviewer['id']).get_json()
+
+    assert body['updated'] == 0
+    assert body['results'][0]['message'] == 'Job is already assigned to this reviewer'
+    assert jobs.notifications_store == {}
+
+
+def test_partial_failures_reported_per_job(admin, customer):
+    good = create_jobs(customer[0], 1, deadline='2026-10-20T10:00:00Z')[0]
+    no_deadline = create_jobs(customer[0], 1)[0]
+
+    response = batch(admin, jobIds=[good, 'missing', no_deadline], action='extend_deadline', extendHours=24)
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body['updated'], body['failed']) == (1, 2)
+    assert [r['jobId'] for r in body['results']] == [good, 'missing', no_deadline]
+    assert body['results'][1]['message'] == 'Job not found'
+    assert body['results'][2]['message'] == 'Job has no deadline'
+    assert jobs.jobs_store[good]['deadline'] == '2026-10-21T10:00:00Z'
+
+
+def test_invalid_deadline_does_not_half_apply(admin, customer):
+    first, broken, last = create_jobs(customer[0], 3, deadline='2026-10-20T10:00:00')
+    jobs.jobs_store[broken]['deadline'] = 'next tuesday'
+
+    response = batch(admin, jobIds=[first, broken, last], action='extend_deadline', extendHours=1)
+
+    body = response.get_json()
+    assert body['results'][1] == {'jobId': broken, 'success': False, 'message': 'Job has an invalid deadline'}
+    assert jobs.jobs_store[first]['deadline'] == '2026-10-20T11:00:00'
+    assert jobs.jobs_store[last]['deadline'] == '2026-10-20T11:00:00'
+    assert jobs.jobs_store[broken]['deadline'] == 'next tuesday'
+
+
+def test_duplicate_ids_applied_once(admin, customer):
+    job_id = create_jobs(customer[0], 1, deadline='2026-10-20T10:00:00')[0]
+
+    response = batch(admin, jobIds=[job_id, job_id], action='extend_deadline', extendHours=2)
+
+    assert len(response.get_json()['results']) == 1
+    assert jobs.jobs_store[job_id]['deadline'] == '2026-10-20T12:00:00'
+
+
+def test_one_notification_per_affected_user(admin, customer, reviewer):
+    job_ids = create_jobs(customer[0], 3, status='paid')
+
+    batch(admin, jobIds=job_ids, action='reassign', reviewerId=reviewer['id'])
+
+    customer_notes = notifications_for(customer[1]['id'])
+    reviewer_notes = notifications_for(reviewer['id'])
+    assert len(customer_notes) == 1
+    assert len(reviewer_notes) == 1
+    assert customer_notes[0]['metadata'] == {'action': 'reassign', 'jobIds': job_ids}
+    assert len(customer[0].get('/api/notifications').get_json()) == 1
+
+
+def test_previous_reviewer_is_notified(admin, customer, reviewer, app):
+    other = login(app.test_client(), 'other@example.com', role='reviewer')
+    job_ids = create_jobs(customer[0], 2, reviewerId=other['id'])
+
+    batch(admin, jobIds=job_ids, action='reassign', reviewerId=reviewer['id'])
+
+    assert notifications_for(other['id'])[0]['metadata']['jobIds'] == job_ids
+
+
+def test_no_notifications_when_nothing_updated(admin):
+    batch(admin, jobIds=['missing'], action='status', status='cancelled')
+
+    assert jobs.notifications_store == {}
+
+
+def test_reviewers_listed_once_across_logins(admin, app):
+    first = login(app.test_client(), 'reviewer@example.com', role='reviewer')
+    again = login(app.test_client(), 'Reviewer@example.com')
+
+    reviewers = admin.get('/api/admin/reviewers').get_json()
+
+    assert again['id'] == first['id']
+    assert again['role'] == 'reviewer'
+    assert [r['id'] for r in reviewers] == [first['id']]
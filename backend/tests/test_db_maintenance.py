@@ -0,0 +1,90 @@
+from datetime import date
+
+from app.db_maintenance import add_months, index_names, partition_name, plan_problems, seq_scans
+
+
+def index_scan(index, table):
+    return {'Node Type': 'Index Scan', 'Index Name': index, 'Relation Name': table}
+
+
+def partitioned_scan(*children):
+    return {'Node Type': 'Limit', 'Plans': [{'Node Type': 'Merge Append', 'Plans': list(children)}]}
+
+
+def test_add_months_within_year():
+    assert add_months(date(2026, 3, 17), 2) == date(2026, 5, 1)
+
+
+def test_add_months_rolls_over_december():
+    assert add_months(date(2026, 12, 5), 1) == date(2027, 1, 1)
+    assert add_months(date(2026, 11, 30), 14) == date(2028, 1, 1)
+
+
+def test_add_months_zero_returns_month_start():
+    assert add_months(date(2026, 10, 19), 0) == date(2026, 10, 1)
+
+
+def test_partition_name():
+    assert partition_name('payments', date(2027, 1, 1)) == 'payments_p2027_01'
+
+
+def test_seq_scans_finds_nested_nodes():
+    plan = {
+        'Node Type': 'Nested Loop',
+        'Plans': [
+            {'Node Type': 'Seq Scan', 'Relation Name': 'jobs'},
+            {'Node Type': 'Hash', 'Plans': [{'Node Type': 'Seq Scan', 'Relation Name': 'job_files'}]},
+        ],
+    }
+
+    assert seq_scans(plan) == ['jobs', 'job_files']
+
+
+def test_seq_scans_empty_for_index_plan():
+    assert seq_scans(index_scan('IDX_files_job', 'job_files')) == []
+
+
+def test_index_names_walks_bitmap_and_partition_scans():
+    bitmap = {
+        'Node Type': 'Bitmap Heap Scan',
+        'Plans': [{'Node Type': 'Bitmap Index Scan', 'Index Name': 'IDX_payments_order'}],
+    }
+    plan = partitioned_scan(bitmap, index_scan('payments_default_order_id_idx', 'payments_default'))
+
+    assert index_names(plan) == ['IDX_payments_order', 'payments_default_order_id_idx']
+
+
+def test_plan_problems_accepts_expected_index():
+    plan = {'Node Type': 'Limit', 'Plans': [index_scan('IDX_jobs_customer_created', 'jobs')]}
+
+    assert plan_problems(plan, 'IDX_jobs_customer_created', {}) == []
+
+
+def test_plan_problems_maps_partition_indexes_to_parent():
+    plan = partitioned_scan(
+        index_scan('notifications_p2026_10_user_id_is_read_created_at_idx', 'notifications_p2026_10'),
+        index_scan('notifications_default_user_id_is_read_created_at_idx', 'notifications_default'),
+    )
+    parents = {
+        'notifications_p2026_10_user_id_is_read_created_at_idx': 'IDX_notifications_user_read_created',
+        'notifications_default_user_id_is_read_created_at_idx': 'IDX_notifications_user_read_created',
+    }
+
+    assert plan_problems(plan, 'IDX_notifications_user_read_created', parents) == []
+
+
+def test_plan_problems_flags_wrong_index():
+    plan = index_scan('IDX_jobs_customer', 'jobs')
+
+    assert plan_problems(plan, 'IDX_jobs_customer_created', {}) == [
+        'expected IDX_jobs_customer_created, plan uses IDX_jobs_customer',
+    ]
+
+
+def test_plan_problems_flags_seq_scan_without_index():
+    plan = {'Node Type': 'Seq Scan', 'Relation Name': 'job_files'}
+
+    assert plan_problems(plan, 'IDX_files_job', {}) == [
+        'sequential scan on job_files',
+        'expected IDX_files_job, plan uses no index',
+    ]
@@ -0,0 +1,110 @@
+import gzip
+
+from app import http_cache
+from app.routes import quotes
+from conftest import login
+
+
+def test_pricing_sets_etag_and_vary(client):
+    response = client.get('/api/pricing')
+
+    assert response.status_code == 200
+    assert response.headers['ETag'].startswith('W/"')
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(response.get_json()) == 3
+
+
+def test_pricing_reuses_precompressed_body(client, monkeypatch):
+    calls = []
+    original = http_cache.compress
+    monkeypatch.setattr(http_cache, 'compress', lambda data, encoding: calls.append(encoding) or original(data, encoding))
+    monkeypatch.setattr(quotes, 'PRICING_PAYLOAD', http_cache.StaticPayload(quotes.PRICING_PAYLOAD_DATA))
+
+    first = client.get('/api/pricing', headers={'Accept-Encoding': 'gzip'})
+    second = client.get('/api/pricing', headers={'Accept-Encoding': 'gzip'})
+
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(second.data) == quotes.PRICING_PAYLOAD.body
+    assert calls == ['gzip']
+
+
+def test_pricing_prefers_brotli(client):
+    response = client.get('/api/pricing', headers={'Accept-Encoding': 'gzip, br'})
+
+    assert response.headers['Content-Encoding'] == 'br'
+
+
+def test_pricing_uncompressed_without_accept_encoding(client):
+    response = client.get('/api/pricing', headers={'Accept-Encoding': 'identity'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert response.data == quotes.PRICING_PAYLOAD.body
+
+
+def test_pricing_not_modified(client):
+    etag = client.get('/api/pricing').headers['ETag']
+
+    response = client.get('/api/pricing', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+
+def test_jobs_not_modified_until_job_changes(client):
+    login(client)
+    job = client.post('/api/jobs', json={'title': 'Thesis'}).get_json()
+    etag = client.get('/api/jobs').headers['ETag']
+
+    assert client.get('/api/jobs', headers={'If-None-Match': etag}).status_code == 304
+
+    client.patch(f"/api/jobs/{job['id']}", json={'title': 'Thesis v2'})
+
+    response = client.get('/api/jobs', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_conditional_skips_view_on_match(client, monkeypatch):
+    login(client)
+    etag = client.get('/api/auth/user').headers['ETag']
+    monkeypatch.setattr('app.routes.auth.jsonify', None)
+
+    response = client.get('/api/auth/user', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+
+
+def test_large_json_compressed_above_threshold(make_app):
+    client = make_app(COMPRESS_MIN_SIZE=64).test_client()
+    login(client)
+    for _ in range(3):
+        client.post('/api/jobs', json={'title': 'A' * 40})
+
+    response = client.get('/api/jobs', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(gzip.decompress(response.data)) > 64
+
+
+def test_small_json_not_compressed(client):
+    login(client)
+
+    response = client.get('/api/jobs', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_user_etag_changes_with_profile(client):
+    login(client)
+    etag = client.get('/api/auth/user').headers['ETag']
+
+    with client.session_transaction() as sess:
+        sess['user']['firstName'] = 'Renamed'
+
+    response = client.get('/api/auth/user', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['firstName'] == 'Renamed'
+    assert response.headers['ETag'] != etag
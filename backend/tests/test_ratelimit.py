@@ -0,0 +1,249 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app import ratelimit
+from app.ratelimit import MemoryStore, RateLimiter, RedisStore, parse_limits, parse_rate
+from conftest import login
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, 'time', SimpleNamespace(monotonic=fake))
+    return fake
+
+
+def test_parse_rate():
+    assert parse_rate('10/minute') == (10, 10 / 60)
+    assert parse_rate('5 / second') == (5, 5)
+
+
+def test_bucket_refills_over_time(clock):
+    store = MemoryStore()
+    capacity, rate = parse_rate('2/minute')
+
+    assert store.consume('k', capacity, rate) == (True, 0)
+    assert store.consume('k', capacity, rate) == (True, 0)
+    allowed, retry_after = store.consume('k', capacity, rate)
+    assert not allowed
+    assert retry_after == pytest.approx(30)
+
+    clock.now += 30
+    assert store.consume('k', capacity, rate) == (True, 0)
+
+
+def test_bucket_never_exceeds_capacity(clock):
+    store = MemoryStore()
+    store.consume('k', 2, 1)
+    clock.now += 3600
+
+    assert store.consume('k', 2, 1)[0]
+    assert store.consume('k', 2, 1)[0]
+    assert not store.consume('k', 2, 1)[0]
+
+
+def test_sweep_drops_idle_buckets(clock, monkeypatch):
+    monkeypatch.setattr(MemoryStore, 'SWEEP_EVERY', 2)
+    store = MemoryStore()
+    store.consume('idle', 5, 1)
+    clock.now += MemoryStore.IDLE_TTL + 1
+    store.consume('active', 5, 1)
+
+    assert set(store._buckets) == {'active'}
+
+
+def test_blocked_key_skips_store(clock):
+    calls = []
+
+    class CountingStore(MemoryStore):
+        def consume(self, key, capacity, rate):
+            calls.append(key)
+            return super().consume(key, capacity, rate)
+
+    limiter = RateLimiter(CountingStore())
+    limiter.hit('k', 1, 0.1)
+    limiter.hit('k', 1, 0.1)
+
+    allowed, retry_after = limiter.hit('k', 1, 0.1)
+
+    assert not allowed
+    assert retry_after == pytest.approx(10)
+    assert len(calls) == 2
+
+    clock.now += 10
+    assert limiter.hit('k', 1, 0.1)[0]
+    assert len(calls) == 3
+
+
+def test_endpoint_limit_overrides_blueprint():
+    limiter = RateLimiter()
+    limiter.configure({'auth': '30/minute', 'auth.login': '5/minute', 'jobs': None})
+
+    assert limiter.limit_for('auth.login', 'auth') == parse_rate('5/minute')
+    assert limiter.limit_for('auth.logout', 'auth') == parse_rate('30/minute')
+    assert limiter.limit_for('jobs.get_jobs', 'jobs') is None
+
+
+def test_app_config_overrides_defaults(make_app):
+    client = make_app(RATELIMIT_ENABLED=True, RATELIMITS={'quotes': '1/minute'}).test_client()
+
+    assert client.get('/api/pricing').status_code == 200
+    assert client.get('/api/pricing').status_code == 429
+
+
+def test_login_returns_429_with_retry_after(make_app, clock):
+    client = make_app(RATELIMIT_ENABLED=True).test_client()
+    for i in range(30):
+        assert login(client, f'user{i}@example.com')
+
+    response = client.post('/api/auth/login', json={'email': 'a@example.com', 'password': 'x'})
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '2'
+    assert response.get_json() == {'message': 'Too many requests'}
+
+
+def test_login_limited_per_account_across_ips(make_app):
+    client = make_app(
+        RATELIMIT_ENABLED=True,
+        TRUSTED_PROXY_COUNT=1,
+        RATELIMITS={'auth.login.account': '2/minute'},
+    ).test_client()
+    body = {'email': 'Victim@Example.com', 'password': 'guess'}
+
+    statuses = [
+        client.post('/api/auth/login', json=body, headers={'X-Forwarded-For': f'198.51.100.{i}'}).status_code
+        for i in range(3)
+    ]
+    other = client.post('/api/auth/login', json={'email': 'other@example.com', 'password': 'x'})
+
+    assert statuses == [200, 200, 429]
+    assert other.status_code == 200
+
+
+def test_shared_ip_users_not_locked_out_by_one_account(make_app):
+    client = make_app(RATELIMIT_ENABLED=True, RATELIMITS={'auth.login.account': '1/minute'}).test_client()
+
+    client.post('/api/auth/login', json={'email': 'noisy@example.com', 'password': 'x'})
+    assert client.post('/api/auth/login', json={'email': 'noisy@example.com', 'password': 'x'}).status_code == 429
+
+    assert client.post('/api/auth/login', json={'email': 'quiet@example.com', 'password': 'x'}).status_code == 200
+
+
+def test_parse_limits():
+    assert parse_limits('auth.login=60/minute, quotes=2/second,') == {
+        'auth.login': '60/minute',
+        'quotes': '2/second',
+    }
+
+
+def test_limits_from_environment(monkeypatch, make_app):
+    monkeypatch.setenv('RATELIMITS', 'quotes=1/minute')
+    client = make_app(RATELIMIT_ENABLED=True).test_client()
+
+    assert client.get('/api/pricing').status_code == 200
+    assert client.get('/api/pricing').status_code == 429
+
+
+def test_forwarded_ips_get_separate_buckets(make_app):
+    client = make_app(RATELIMIT_ENABLED=True, TRUSTED_PROXY_COUNT=1, RATELIMITS={'quotes': '1/minute'}).test_client()
+
+    first = {'X-Forwarded-For': '198.51.100.1'}
+    second = {'X-Forwarded-For': '198.51.100.2'}
+
+    assert client.get('/api/pricing', headers=first).status_code == 200
+    assert client.get('/api/pricing', headers=first).status_code == 429
+    assert client.get('/api/pricing', headers=second).status_code == 200
+
+
+def test_forwarded_for_ignored_without_trusted_proxy(make_app):
+    client = make_app(RATELIMIT_ENABLED=True, RATELIMITS={'quotes': '1/minute'}).test_client()
+
+    assert client.get('/api/pricing', headers={'X-Forwarded-For': '198.51.100.1'}).status_code == 200
+    assert client.get('/api/pricing', headers={'X-Forwarded-For': '198.51.100.2'}).status_code == 429
+
+
+def test_redis_outage_falls_back_to_memory():
+    store = RedisStore('redis://127.0.0.1:1/0')
+
+    assert store.consume('k', 1, 1) == (True, 0)
+    assert not store.consume('k', 1, 1)[0]
+
+
+def test_redis_outage_skips_store_during_cooldown(clock, caplog):
+    store = RedisStore('redis://127.0.0.1:1/0')
+    calls = []
+
+    def failing_script(keys, args):
+        calls.append(keys)
+        raise ratelimit.redis.ConnectionError('down')
+
+    store._script = failing_script
+    for _ in range(5):
+        store.consume('k', 100, 1)
+
+    assert len(calls) == 1
+    assert len(caplog.records) == 1
+
+    clock.now += RedisStore.FAILURE_COOLDOWN
+    store.consume('k', 100, 1)
+    assert len(calls) == 2
+    assert len(caplog.records) == 1
+
+    store._script = lambda keys, args: '0'
+    clock.now += RedisStore.FAILURE_COOLDOWN
+    assert store.consume('k', 100, 1) == (True, 0)
+    assert caplog.records[-1].getMessage() == 'Rate limit store recovered'
+
+
+def test_storage_url_without_redis_client_fails_loudly(make_app, monkeypatch):
+    monkeypatch.setattr(ratelimit, 'redis', None)
+
+    with pytest.raises(RuntimeError):
+        make_app(RATELIMIT_STORAGE_URL='redis://127.0.0.1:6379/0')
+
+
+def time_per_call(fn, iterations=20000):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations
+
+
+@pytest.mark.benchmark
+def test_benchmark_blocked_key_path():
+    class DenyOnceStore:
+        calls = 0
+
+        def consume(self, key, capacity, rate):
+            self.calls += 1
+            return False, 3600
+
+    store = DenyOnceStore()
+    limiter = RateLimiter(store)
+    limiter.hit('k', 1, 1)
+
+    per_call = time_per_call(lambda i: limiter.hit('k', 1, 1))
+
+    assert store.calls == 1
+    print(f'\nblocked key, no store round trip: {per_call * 1e6:.2f} us/call')
+
+
+@pytest.mark.benchmark
+def test_benchmark_memory_store_path():
+    limiter = RateLimiter()
+    capacity, rate = parse_rate('1000000/second')
+
+    per_call = time_per_call(lambda i: limiter.hit(f'key-{i % 100}', capacity, rate))
+
+    print(f'\nin-process bucket: {per_call * 1e6:.2f} us/call')
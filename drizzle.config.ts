@@ -8,6 +8,22 @@ export default defineConfig({
   out: "./migrations",
   schema: "./shared/schema.ts",
   dialect: "postgresql",
+  // Only the tables defined in shared/schema.ts. notifications, payments and
+  // their monthly partitions are owned by the Alembic migrations and must
+  // stay invisible to db:push; add new schema.ts tables here.
+  tablesFilter: [
+    "sessions",
+    "users",
+    "reviewer_profiles",
+    "jobs",
+    "job_files",
+    "quotes",
+    "orders",
+    "invoices",
+    "disputes",
+    "pricing_config",
+    "exchange_rates",
+  ],
   dbCredentials: {
     url: process.env.DATABASE_URL,
   },
@@ -1,6 +1,7 @@
 import { drizzle } from "drizzle-orm/node-postgres";
 import pg from "pg";
 import * as schema from "@shared/schema";
+import * as partitionedSchema from "@shared/partitionedSchema";
 
 const { Pool } = pg;
 
@@ -11,4 +12,4 @@ if (!process.env.DATABASE_URL) {
 }
 
 export const pool = new Pool({ connectionString: process.env.DATABASE_URL });
-export const db = drizzle(pool, { schema });
+export const db = drizzle(pool, { schema: { ...schema, ...partitionedSchema } });
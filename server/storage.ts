@@ -1,14 +1,18 @@
 import { eq, desc, and, isNull, sql } from "drizzle-orm";
 import { db } from "./db";
 import {
-  users, jobs, jobFiles, quotes, orders, payments, invoices,
-  notifications, disputes, reviewerProfiles, pricingConfig, exchangeRates,
+  users, jobs, jobFiles, quotes, orders, invoices,
+  disputes, reviewerProfiles, pricingConfig, exchangeRates,
   type User, type UpsertUser, type Job, type InsertJob, type JobFile, type InsertJobFile,
-  type Quote, type InsertQuote, type Order, type InsertOrder, type Payment, type InsertPayment,
-  type Invoice, type InsertInvoice, type Notification, type InsertNotification,
+  type Quote, type InsertQuote, type Order, type InsertOrder,
+  type Invoice, type InsertInvoice,
   type Dispute, type InsertDispute, type ReviewerProfile, type InsertReviewerProfile,
   type PricingConfig, type ExchangeRate
 } from "@shared/schema";
+import {
+  payments, notifications,
+  type Payment, type InsertPayment, type Notification, type InsertNotification,
+} from "@shared/partitionedSchema";
 
 export interface IStorage {
   getUser(id: string): Promise<User | undefined>;
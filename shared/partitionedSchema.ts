@@ -0,0 +1,71 @@
+import { sql, relations } from 'drizzle-orm';
+import {
+  index,
+  jsonb,
+  pgTable,
+  timestamp,
+  varchar,
+  text,
+  decimal,
+  boolean,
+} from "drizzle-orm/pg-core";
+import { createInsertSchema } from "drizzle-zod";
+import { z } from "zod";
+import { users, orders, currencyEnum, paymentStatusEnum } from "./schema";
+
+// Tables range-partitioned by created_at. Their DDL is owned by the Alembic
+// migrations in backend/migrations, so they live outside shared/schema.ts
+// (the only file drizzle-kit reads) and db:push never creates or alters
+// them. In the database the primary key is (id, created_at).
+
+// Payments
+export const payments = pgTable("payments", {
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+  orderId: varchar("order_id").notNull().references(() => orders.id, { onDelete: 'cascade' }),
+  gateway: varchar("gateway").notNull(),
+  gatewayTransactionId: varchar("gateway_transaction_id"),
+  amount: decimal("amount", { precision: 10, scale: 2 }).notNull(),
+  currency: currencyEnum("currency").default('ZAR'),
+  status: paymentStatusEnum("status").default('pending'),
+  paidAt: timestamp("paid_at"),
+  metadata: jsonb("metadata"),
+  createdAt: timestamp("created_at").defaultNow(),
+  updatedAt: timestamp("updated_at").defaultNow(),
+}, (table) => [
+  index("IDX_payments_order").on(table.orderId),
+  index("IDX_payments_status").on(table.status),
+  index("IDX_payments_gateway_tx").on(table.gatewayTransactionId),
+]);
+
+// Notifications
+export const notifications = pgTable("notifications", {
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+  userId: varchar("user_id").notNull().references(() => users.id, { onDelete: 'cascade' }),
+  type: varchar("type").notNull(),
+  title: varchar("title").notNull(),
+  message: text("message"),
+  isRead: boolean("is_read").default(false),
+  metadata: jsonb("metadata"),
+  createdAt: timestamp("created_at").defaultNow(),
+}, (table) => [
+  index("IDX_notifications_user_read_created").on(table.userId, table.isRead, table.createdAt),
+]);
+
+// Relations
+export const userNotificationsRelations = relations(users, ({ many }) => ({
+  notifications: many(notifications),
+}));
+
+export const orderPaymentsRelations = relations(orders, ({ many }) => ({
+  payments: many(payments),
+}));
+
+// Insert schemas
+export const insertPaymentSchema = createInsertSchema(payments).omit({ id: true, createdAt: true, updatedAt: true });
+export const insertNotificationSchema = createInsertSchema(notifications).omit({ id: true, createdAt: true });
+
+// Types
+export type Payment = typeof payments.$inferSelect;
+export type InsertPayment = z.infer<typeof insertPaymentSchema>;
+export type Notification = typeof notifications.$inferSelect;
+export type InsertNotification = z.infer<typeof insertNotificationSchema>;
@@ -97,9 +97,9 @@ export const jobs = pgTable("jobs", {
   createdAt: timestamp("created_at").defaultNow(),
   updatedAt: timestamp("updated_at").defaultNow(),
 }, (table) => [
-  index("IDX_jobs_customer").on(table.customerId),
+  index("IDX_jobs_customer_created").on(table.customerId, table.createdAt),
   index("IDX_jobs_reviewer").on(table.reviewerId),
-  index("IDX_jobs_status").on(table.status),
+  index("IDX_jobs_status_deadline").on(table.status, table.deadline),
   index("IDX_jobs_created").on(table.createdAt),
 ]);
 
@@ -153,25 +153,6 @@ export const orders = pgTable("orders", {
   index("IDX_orders_number").on(table.orderNumber),
 ]);
 
-// Payments
-export const payments = pgTable("payments", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  orderId: varchar("order_id").notNull().references(() => orders.id, { onDelete: 'cascade' }),
-  gateway: varchar("gateway").notNull(),
-  gatewayTransactionId: varchar("gateway_transaction_id"),
-  amount: decimal("amount", { precision: 10, scale: 2 }).notNull(),
-  currency: currencyEnum("currency").default('ZAR'),
-  status: paymentStatusEnum("status").default('pending'),
-  paidAt: timestamp("paid_at"),
-  metadata: jsonb("metadata"),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-}, (table) => [
-  index("IDX_payments_order").on(table.orderId),
-  index("IDX_payments_status").on(table.status),
-  index("IDX_payments_gateway_tx").on(table.gatewayTransactionId),
-]);
-
 // Invoices
 export const invoices = pgTable("invoices", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -192,21 +173,6 @@ export const invoices = pgTable("invoices", {
   index("IDX_invoices_number").on(table.invoiceNumber),
 ]);
 
-// Notifications
-export const notifications = pgTable("notifications", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  userId: varchar("user_id").notNull().references(() => users.id, { onDelete: 'cascade' }),
-  type: varchar("type").notNull(),
-  title: varchar("title").notNull(),
-  message: text("message"),
-  isRead: boolean("is_read").default(false),
-  metadata: jsonb("metadata"),
-  createdAt: timestamp("created_at").defaultNow(),
-}, (table) => [
-  index("IDX_notifications_user").on(table.userId),
-  index("IDX_notifications_read").on(table.isRead),
-]);
-
 // Disputes
 export const disputes = pgTable("disputes", {
   id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
@@ -258,7 +224,6 @@ export const usersRelations = relations(users, ({ one, many }) => ({
   customerJobs: many(jobs, { relationName: 'customerJobs' }),
   reviewerJobs: many(jobs, { relationName: 'reviewerJobs' }),
   orders: many(orders),
-  notifications: many(notifications),
 }));
 
 export const jobsRelations = relations(jobs, ({ one, many }) => ({
@@ -291,7 +256,6 @@ export const ordersRelations = relations(orders, ({ one, many }) => ({
     fields: [orders.customerId],
     references: [users.id],
   }),
-  payments: many(payments),
   invoices: many(invoices),
 }));
 
@@ -301,9 +265,7 @@ export const insertJobSchema = createInsertSchema(jobs).omit({ id: true, created
 export const insertJobFileSchema = createInsertSchema(jobFiles).omit({ id: true, uploadedAt: true });
 export const insertQuoteSchema = createInsertSchema(quotes).omit({ id: true, createdAt: true });
 export const insertOrderSchema = createInsertSchema(orders).omit({ id: true, createdAt: true, updatedAt: true });
-export const insertPaymentSchema = createInsertSchema(payments).omit({ id: true, createdAt: true, updatedAt: true });
 export const insertInvoiceSchema = createInsertSchema(invoices).omit({ id: true, issuedAt: true });
-export const insertNotificationSchema = createInsertSchema(notifications).omit({ id: true, createdAt: true });
 export const insertDisputeSchema = createInsertSchema(disputes).omit({ id: true, createdAt: true, updatedAt: true });
 export const insertReviewerProfileSchema = createInsertSchema(reviewerProfiles).omit({ id: true, createdAt: true, updatedAt: true });
 
@@ -318,12 +280,8 @@ export type Quote = typeof quotes.$inferSelect;
 export type InsertQuote = z.infer<typeof insertQuoteSchema>;
 export type Order = typeof orders.$inferSelect;
 export type InsertOrder = z.infer<typeof insertOrderSchema>;
-export type Payment = typeof payments.$inferSelect;
-export type InsertPayment = z.infer<typeof insertPaymentSchema>;
 export type Invoice = typeof invoices.$inferSelect;
 export type InsertInvoice = z.infer<typeof insertInvoiceSchema>;
-export type Notification = typeof notifications.$inferSelect;
-export type InsertNotification = z.infer<typeof insertNotificationSchema>;
 export type Dispute = typeof disputes.$inferSelect;
 export type InsertDispute = z.infer<typeof insertDisputeSchema>;
 export type ReviewerProfile = typeof reviewerProfiles.$inferSelect;